@@ -29,7 +29,6 @@ from glue.core.subset import (RangeSubsetState, RoiSubsetState,
 from glue.core.units import unit_converter
 from glue_astronomy.spectral_coordinates import SpectralCoordinates
 from glue_astronomy.translators.regions import roi_subset_state_to_region
-from glue_jupyter.app import JupyterApplication
 from glue_jupyter.common.toolbar_vuetify import read_icon
 from glue_jupyter.state_traitlets_helpers import GlueState
 from ipypopout import PopoutButton
@@ -283,7 +282,9 @@ class Application(VuetifyTemplate, HubListener):
         self.state = ApplicationState()
 
         # The application handler stores the state of the data and the
-        #  underlying glue infrastructure
+        #  underlying glue infrastructure. Imported here rather than at module
+        #  scope since glue_jupyter.app pulls in every viewer implementation.
+        from glue_jupyter.app import JupyterApplication
         self._application_handler = JupyterApplication(
             settings={'new_subset_on_selection_tool_change': True,
                       'single_global_active_tool': False})
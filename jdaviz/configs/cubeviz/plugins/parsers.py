@@ -7,8 +7,6 @@ from astropy import units as u
 from astropy.io import fits
 from astropy.nddata import StdDevUncertainty
 from astropy.time import Time
-from astropy.wcs import WCS
-from specutils import Spectrum1D
 
 from jdaviz.core.custom_units import PIX2
 from jdaviz.core.registries import data_parser_registry
@@ -18,10 +16,18 @@ from jdaviz.utils import (standardize_metadata, PRIHDR_KEY, download_uri_to_path
 
 __all__ = ['parse_data']
 
+_logger = logging.getLogger(__name__)
+
 EXT_TYPES = dict(flux=['flux', 'sci', 'data'],
                  uncert=['ivar', 'err', 'error', 'var', 'uncert'],
                  mask=['mask', 'dq', 'quality', 'data_quality'])
 
+# Single-pass token -> type lookup for _get_data_type_by_hdu. Mask tokens come
+# first so that, e.g., 'DATA_QUALITY' classifies as mask rather than flux.
+_EXT_TOKEN_TO_TYPE = {tok: ext_type
+                      for ext_type in ('mask', 'uncert', 'flux')
+                      for tok in EXT_TYPES[ext_type]}
+
 
 @data_parser_registry("cubeviz-data-parser")
 def parse_data(app, file_obj, data_type=None, data_label=None,
@@ -54,6 +60,9 @@ def parse_data(app, file_obj, data_type=None, data_label=None,
         `~astropy.utils.data.download_file` or
         `~astroquery.mast.Conf.timeout`).
     """
+    # Deferred to keep heavy dependencies (specutils pulls in scipy) off the
+    # import path of jdaviz itself; this module is imported via the registry.
+    from specutils import Spectrum1D
 
     flux_viewer_reference_name = app._jdaviz_helper._default_flux_viewer_reference_name
     uncert_viewer_reference_name = app._jdaviz_helper._default_uncert_viewer_reference_name
@@ -105,6 +114,12 @@ def parse_data(app, file_obj, data_type=None, data_label=None,
             if telescop == 'jwst' and ('ifu' in exptype or
                                        'mrs' in exptype or
                                        filetype == '3d ifu cube'):
+                # Standardize the PRIMARY header once; it is shared by all
+                # extensions loaded below.
+                if 'PRIMARY' in hdulist:
+                    primary_meta = standardize_metadata(hdulist['PRIMARY'].header)
+                else:
+                    primary_meta = None
                 for ext, viewer_name in (('SCI', flux_viewer_reference_name),
                                          ('ERR', uncert_viewer_reference_name),
                                          ('DQ', None)):
@@ -125,9 +140,13 @@ def parse_data(app, file_obj, data_type=None, data_label=None,
                     _parse_jwst_s3d(
                         app, hdulist, data_label, ext=ext, viewer_name=viewer_name,
                         flux_viewer_reference_name=flux_viewer_reference_name,
-                        parent=parent_data_label
+                        parent=parent_data_label, primary_meta=primary_meta
                     )
             elif telescop == 'jwst' and filetype == 'r3d' and system == 'esa-pipeline':
+                if 'PRIMARY' in hdulist:
+                    primary_meta = standardize_metadata(hdulist['PRIMARY'].header)
+                else:
+                    primary_meta = None
                 for ext, viewer_name in (('DATA', flux_viewer_reference_name),
                                          ('ERR', uncert_viewer_reference_name),
                                          ('QUALITY', None)):
@@ -135,6 +154,7 @@ def parse_data(app, file_obj, data_type=None, data_label=None,
                     _parse_esa_s3d(
                         app, hdulist, data_label, ext=ext, viewer_name=viewer_name,
                         flux_viewer_reference_name=flux_viewer_reference_name,
+                        primary_meta=primary_meta
                     )
             else:
                 try:
@@ -174,6 +194,11 @@ def parse_data(app, file_obj, data_type=None, data_label=None,
         raise NotImplementedError(f'Unsupported data format: {file_obj}')
 
 
+def _attach_unit(arr, unit):
+    """Stamp ``unit`` onto ``arr`` without copying the (possibly memmapped) data."""
+    return u.Quantity(arr, unit=unit, copy=False, subok=True)
+
+
 def _get_celestial_wcs(wcs):
     """ If `wcs` has a celestial component return that, otherwise return None """
     return wcs.celestial if hasattr(wcs, 'celestial') else None
@@ -188,6 +213,8 @@ def _return_spectrum_with_correct_units(flux, wcs, metadata, data_type=None,
     Also converts flux units to flux/pix2 solid angle units, if `flux` is not a surface
     brightness and `apply_pix2` is True.
     """
+    from specutils import Spectrum1D
+
     # handle scale factors when they are included in the unit
     # (has to be done before Spectrum1D creation)
     if not np.isclose(flux.unit.scale, 1, rtol=1e-5):
@@ -206,21 +233,7 @@ def _return_spectrum_with_correct_units(flux, wcs, metadata, data_type=None,
         target_flux_unit = flux.unit / PIX2
 
     if target_wave_unit is None and hdulist is not None:
-        found_target = False
-        for ext in ('SCI', 'FLUX', 'PRIMARY', 'DATA'):  # In priority order
-            if found_target:
-                break
-            if ext not in hdulist:
-                continue
-            hdr = hdulist[ext].header
-            # The WCS could be swapped or unswapped.
-            for cunit_num in (3, 1):
-                cunit_key = f"CUNIT{cunit_num}"
-                ctype_key = f"CTYPE{cunit_num}"
-                if cunit_key in hdr and 'WAV' in hdr[ctype_key]:
-                    target_wave_unit = u.Unit(hdr[cunit_key])
-                    found_target = True
-                    break
+        target_wave_unit = _get_target_wave_unit(hdulist)
 
     if target_wave_unit == sc.spectral_axis.unit:
         target_wave_unit = None
@@ -241,6 +254,21 @@ def _return_spectrum_with_correct_units(flux, wcs, metadata, data_type=None,
     return new_sc
 
 
+def _get_target_wave_unit(hdulist):
+    """Scan the likely science extensions for a wavelength CUNIT."""
+    for ext in ('SCI', 'FLUX', 'PRIMARY', 'DATA'):  # In priority order
+        try:  # One lookup instead of a membership scan plus a lookup
+            hdr = hdulist[ext].header
+        except KeyError:
+            continue
+        # The WCS could be swapped or unswapped.
+        for cunit_num in (3, 1):
+            cunit = hdr.get(f"CUNIT{cunit_num}")
+            if cunit is not None and 'WAV' in hdr.get(f"CTYPE{cunit_num}", ''):
+                return u.Unit(cunit)
+    return None
+
+
 def _parse_hdulist(app, hdulist, file_name=None,
                    flux_viewer_reference_name=None,
                    uncert_viewer_reference_name=None):
@@ -249,9 +277,19 @@ def _parse_hdulist(app, hdulist, file_name=None,
     else:
         file_name = file_name or "Unknown HDU object"
 
-    is_loaded = []
+    from astropy.wcs import WCS
+
+    is_loaded = set()
     wcs_sci = None
 
+    # Resolve these once up front; they are the same for every HDU in the
+    # file, and re-deriving them per extension gets expensive for large MEFs.
+    target_wave_unit = _get_target_wave_unit(hdulist)
+    if 'PRIMARY' in hdulist:
+        primary_meta = standardize_metadata(hdulist['PRIMARY'].header)
+    else:
+        primary_meta = None
+
     # TODO: This needs refactoring to be more robust.
     # Current logic fails if there are multiple EXTVER.
     for hdu in hdulist:
@@ -266,7 +304,7 @@ def _parse_hdulist(app, hdulist, file_name=None,
         if data_type in is_loaded:
             continue
 
-        is_loaded.append(data_type)
+        is_loaded.add(data_type)
         data_label = app.return_data_label(file_name, hdu.name)
 
         if data_type == 'flux':
@@ -275,23 +313,25 @@ def _parse_hdulist(app, hdulist, file_name=None,
         else:
             wcs = wcs_sci
 
-        if 'BUNIT' in hdu.header:
+        bunit = hdu.header.get('BUNIT')
+        if bunit is not None:
             try:
-                flux_unit = u.Unit(hdu.header['BUNIT'])
+                flux_unit = u.Unit(bunit)
             except Exception:
-                logging.warning("Invalid BUNIT, using count as data unit")
+                _logger.warning("Invalid BUNIT, using count as data unit")
                 flux_unit = u.count
         elif data_type == 'mask':  # DQ flags have no unit
             flux_unit = u.dimensionless_unscaled
         else:
-            logging.warning("Invalid BUNIT, using count as data unit")
+            # Missing BUNIT is the common case for unitless extensions;
+            # default quietly rather than warning once per HDU.
             flux_unit = u.count
 
-        flux = hdu.data << flux_unit
+        flux = _attach_unit(hdu.data, flux_unit)
 
         metadata = standardize_metadata(hdu.header)
-        if hdu.name != 'PRIMARY' and 'PRIMARY' in hdulist:
-            metadata[PRIHDR_KEY] = standardize_metadata(hdulist['PRIMARY'].header)
+        if hdu.name != 'PRIMARY' and primary_meta is not None:
+            metadata[PRIHDR_KEY] = primary_meta
 
         # store original WCS in metadata. this is a hacky workaround for converting subsets
         # to sky regions, where the parent data of the subset might have dropped spatial WCS info
@@ -299,7 +339,8 @@ def _parse_hdulist(app, hdulist, file_name=None,
 
         apply_pix2 = data_type in ['flux', 'uncert']
         sc = _return_spectrum_with_correct_units(flux, wcs, metadata, data_type=data_type,
-                                                 hdulist=hdulist, apply_pix2=apply_pix2)
+                                                 target_wave_unit=target_wave_unit,
+                                                 apply_pix2=apply_pix2)
 
         app.add_data(sc, data_label)
 
@@ -322,7 +363,9 @@ def _parse_hdulist(app, hdulist, file_name=None,
 
 def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
                     viewer_name=None, flux_viewer_reference_name=None,
-                    parent=None):
+                    parent=None, primary_meta=None):
+    from astropy.wcs import WCS
+
     hdu = hdulist[ext]
     data_type = _get_data_type_by_hdu(hdu)
 
@@ -341,10 +384,10 @@ def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
                     break
 
     if ext == 'DQ':  # DQ flags have no unit
-        flux = hdu.data << u.dimensionless_unscaled
+        flux = _attach_unit(hdu.data, u.dimensionless_unscaled)
     else:
         unit = u.Unit(hdu.header.get('BUNIT', 'count'))
-        flux = hdu.data << unit
+        flux = _attach_unit(hdu.data, unit)
     wcs = WCS(hdulist['SCI'].header, hdulist)  # Everything uses SCI WCS
 
     metadata = standardize_metadata(hdu.header)
@@ -354,7 +397,9 @@ def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
     metadata['_orig_spatial_wcs'] = _get_celestial_wcs(wcs)
 
     if hdu.name != 'PRIMARY' and 'PRIMARY' in hdulist:
-        metadata[PRIHDR_KEY] = standardize_metadata(hdulist['PRIMARY'].header)
+        if primary_meta is None:
+            primary_meta = standardize_metadata(hdulist['PRIMARY'].header)
+        metadata[PRIHDR_KEY] = primary_meta
 
     data = _return_spectrum_with_correct_units(
         flux, wcs, metadata, data_type=data_type, hdulist=hdulist)
@@ -383,15 +428,18 @@ def _parse_jwst_s3d(app, hdulist, data_label, ext='SCI',
         app._jdaviz_helper._loaded_uncert_cube = app.data_collection[data_label]
 
 
-def _parse_esa_s3d(app, hdulist, data_label, ext='DATA', flux_viewer_reference_name=None):
+def _parse_esa_s3d(app, hdulist, data_label, ext='DATA', flux_viewer_reference_name=None,
+                   primary_meta=None):
+    from astropy.wcs import WCS
+
     hdu = hdulist[ext]
     data_type = _get_data_type_by_hdu(hdu)
 
     if ext == 'QUALITY':  # QUALITY flags have no unit
-        flux = hdu.data << u.dimensionless_unscaled
+        flux = _attach_unit(hdu.data, u.dimensionless_unscaled)
     else:
         unit = u.Unit(hdu.header.get('BUNIT', 'count'))
-        flux = hdu.data << unit
+        flux = _attach_unit(hdu.data, unit)
 
     hdr = hdulist[1].header
 
@@ -411,7 +459,9 @@ def _parse_esa_s3d(app, hdulist, data_label, ext='DATA', flux_viewer_reference_n
     metadata = standardize_metadata(hdu.header)
     metadata.update(wcs_dict)  # To be internally consistent
     if hdu.name != 'PRIMARY' and 'PRIMARY' in hdulist:
-        metadata[PRIHDR_KEY] = standardize_metadata(hdulist['PRIMARY'].header)
+        if primary_meta is None:
+            primary_meta = standardize_metadata(hdulist['PRIMARY'].header)
+        metadata[PRIHDR_KEY] = primary_meta
 
     # store original WCS in metadata. this is a hacky workaround for converting subsets
     # to sky regions, where the parent data of the subset might have dropped spatial WCS info
@@ -441,15 +491,25 @@ def _parse_spectrum1d_3d(app, file_obj, data_label=None,
     if data_label is None:
         data_label = "Unknown spectrum object"
 
+    # Viewer and helper-cube destination per attribute; mask is intentionally
+    # absent since we no longer auto-populate the mask cube into a viewer.
+    viewer_for_attr = {'flux': (flux_viewer_reference_name, '_loaded_flux_cube'),
+                       'uncertainty': (uncert_viewer_reference_name, '_loaded_uncert_cube')}
+
     for attr in ("flux", "mask", "uncertainty"):
         val = getattr(file_obj, attr)
         if val is None:
             continue
 
         if attr == "mask":
-            flux = val << u.dimensionless_unscaled  # DQ flags have no unit
+            flux = _attach_unit(val, u.dimensionless_unscaled)  # DQ flags have no unit
         elif attr == "uncertainty":
-            flux = val.represent_as(StdDevUncertainty).quantity
+            # represent_as round-trips through variance (two full-cube array
+            # copies) even when the input already is a standard deviation, so
+            # only convert when we actually have to. .quantity is a view.
+            if not isinstance(val, StdDevUncertainty):
+                val = val.represent_as(StdDevUncertainty)
+            flux = val.quantity
         else:
             flux = val
 
@@ -474,13 +534,11 @@ def _parse_spectrum1d_3d(app, file_obj, data_label=None,
         cur_data_label = app.return_data_label(data_label, attr.upper())
         app.add_data(s1d, cur_data_label)
 
-        if attr == 'flux':
-            app.add_data_to_viewer(flux_viewer_reference_name, cur_data_label)
-            app._jdaviz_helper._loaded_flux_cube = app.data_collection[cur_data_label]
-        elif attr == 'uncertainty':
-            app.add_data_to_viewer(uncert_viewer_reference_name, cur_data_label)
-            app._jdaviz_helper._loaded_uncert_cube = app.data_collection[cur_data_label]
-        # We no longer auto-populate the mask cube into a viewer
+        dispatch = viewer_for_attr.get(attr)
+        if dispatch is not None:
+            viewer_ref, cube_attr = dispatch
+            app.add_data_to_viewer(viewer_ref, cur_data_label)
+            setattr(app._jdaviz_helper, cube_attr, app.data_collection[cur_data_label])
 
 
 def _parse_spectrum1d(app, file_obj, data_label=None, spectrum_viewer_reference_name=None):
@@ -510,6 +568,8 @@ def _parse_spectrum1d(app, file_obj, data_label=None, spectrum_viewer_reference_
 def _parse_ndarray(app, file_obj, data_label=None, data_type=None,
                    flux_viewer_reference_name=None,
                    uncert_viewer_reference_name=None):
+    from specutils import Spectrum1D
+
     if data_label is None:
         data_label = app.return_data_label(file_obj)
 
@@ -521,9 +581,10 @@ def _parse_ndarray(app, file_obj, data_label=None, data_type=None,
     flux = file_obj
 
     if not hasattr(flux, 'unit'):
-        flux = flux << (u.count / PIX2)
+        flux = _attach_unit(flux, u.count / PIX2)
 
-    meta = standardize_metadata({'_orig_spatial_wcs': None})
+    # Already standardized: plain dict with no nested FITS header.
+    meta = {'_orig_spatial_wcs': None}
     s3d = Spectrum1D(flux=flux, meta=meta)
 
     # convert data loaded in flux units to a per-square-pixel surface
@@ -545,6 +606,7 @@ def _parse_gif(app, file_obj, data_label=None, flux_viewer_reference_name=None):
     # NOTE: Parsing GIF needs imageio and Pillow, both are which undeclared
     # in setup.cfg but might or might not be installed by declared ones.
     import imageio
+    from specutils import Spectrum1D
 
     file_name = os.path.basename(file_obj)
 
@@ -552,10 +614,14 @@ def _parse_gif(app, file_obj, data_label=None, flux_viewer_reference_name=None):
         data_label = app.return_data_label(file_obj)
 
     flux = imageio.v3.imread(file_obj, mode='P')  # All frames as gray scale
-    flux = np.rot90(np.moveaxis(flux, 0, 2), k=-1, axes=(0, 1))
+    # Same geometry as rot90(moveaxis(flux, 0, 2), k=-1, axes=(0, 1)), but
+    # materialized in one C-contiguous pass instead of stacking strided views
+    # that get copied downstream anyway.
+    flux = np.ascontiguousarray(flux.transpose(2, 1, 0)[:, ::-1, :])
 
+    # Already standardized: plain dict with no nested FITS header.
     meta = {'filename': file_name, '_orig_spatial_wcs': None}
-    s3d = Spectrum1D(flux=flux * (u.count / PIX2), meta=standardize_metadata(meta))
+    s3d = Spectrum1D(flux=_attach_unit(flux, u.count / PIX2), meta=meta)
 
     app.add_data(s3d, data_label)
     app.add_data_to_viewer(flux_viewer_reference_name, data_label)
@@ -563,14 +629,18 @@ def _parse_gif(app, file_obj, data_label=None, flux_viewer_reference_name=None):
 
 def _get_data_type_by_hdu(hdu):
     # If the data type is some kind of integer, assume it's the mask/dq
-    if (hdu.data.dtype in (int, np.uint, np.uint8, np.uint16, np.uint32) or
-            any(x in hdu.name.lower() for x in EXT_TYPES['mask'])):
-        data_type = 'mask'
-    elif ('errtype' in [x.lower() for x in hdu.header.keys()] or
-            any(x in hdu.name.lower() for x in EXT_TYPES['uncert'])):
+    if hdu.data.dtype.kind in 'iu':
+        return 'mask'
+
+    lname = hdu.name.lower()
+    data_type = ''
+    for tok, ext_type in _EXT_TOKEN_TO_TYPE.items():
+        if tok in lname:
+            data_type = ext_type
+            break
+
+    # ERRTYPE in the header marks an uncertainty extension even when the
+    # extension name says otherwise (unless the name already flagged a mask).
+    if data_type in ('', 'flux') and 'ERRTYPE' in hdu.header:
         data_type = 'uncert'
-    elif any(x in hdu.name.lower() for x in EXT_TYPES['flux']):
-        data_type = 'flux'
-    else:
-        data_type = ''
     return data_type
@@ -1,5 +1,4 @@
 import numpy as np
-from astropy import units as u
 from traitlets import Bool, observe
 
 from jdaviz.core.events import (ViewerAddedMessage, ChangeRefDataMessage,
@@ -134,8 +133,8 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
             # reference data
             new_wcs = viewer.state.reference_data.coords
             try:
-                new_x, new_y = new_wcs.world_to_pixel_values(orig_world_x*u.deg,
-                                                             orig_world_y*u.deg)
+                # world_to_pixel_values takes bare floats in deg; skip Quantity boxing
+                new_x, new_y = new_wcs.world_to_pixel_values(orig_world_x, orig_world_y)
             except Exception:
                 # fail gracefully
                 new_x, new_y = [], []
@@ -149,8 +148,8 @@ class Markers(PluginTemplateMixin, ViewerSelectMixin, TableMixin):
                     continue
                 wcs = self.app.data_collection[data_label].coords
                 try:
-                    new_x[these], new_y[these] = wcs.world_to_pixel_values(orig_world_x[these]*u.deg,  # noqa
-                                                                           orig_world_y[these]*u.deg)  # noqa
+                    new_x[these], new_y[these] = wcs.world_to_pixel_values(orig_world_x[these],
+                                                                           orig_world_y[these])
                 except Exception:
                     # fail gracefully
                     new_x, new_y = [], []
@@ -38,6 +38,10 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
         # provide reference from state back to viewer to use for zoom syncing
         self.state._set_viewer(self)
         self.init_astrowidgets_api()
+
+        # (external_links, {frozenset(labels): align_by}) built lazily by
+        # get_alignment_method and rebuilt whenever the links change
+        self._alignment_cache = None
         self._subscribe_to_layers_update()
 
         self.compass = None
@@ -143,6 +147,22 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
                 self.line_profile_xy.viewer_selected = self.reference_id
                 self.line_profile_xy.vue_draw_plot()
 
+    def _set_top_visible_data(self, data_label):
+        """Directly make ``data_label`` the only visible image layer.
+
+        Unlike `blink_once`, this skips the compass and line-profile updates,
+        so it is cheaper when a specific layer is wanted on top (e.g. tests).
+        """
+        found = False
+        for layer in self.state.layers:
+            if not layer_is_image_data(layer.layer):
+                continue
+            visible = layer.layer.label == data_label
+            layer.visible = visible
+            found = found or visible
+        if not found:
+            raise ValueError(f"{data_label} not found in viewer {self.reference_id}")
+
     def on_limits_change(self, *args):
         try:
             i = get_top_layer_index(self)
@@ -319,15 +339,21 @@ class ImvizImageView(JdavizViewerMixin, BqplotImageView, AstrowidgetsImageViewer
         if ref_label in self.state.wcs_only_layers:
             return 'wcs'
 
-        align_by = None
-        for elink in self.session.application.data_collection.external_links:
-            elink_labels = (elink.data1.label, elink.data2.label)
-            if data_label in elink_labels and ref_label in elink_labels:
-                if isinstance(elink, LinkSame):  # Assumes WCS link never uses LinkSame
-                    align_by = 'pixels'
-                else:  # If not pixels, must be WCS
-                    align_by = 'wcs'
-                break  # Might have duplicate, just grab first match
+        # Classify all links in one pass and reuse the mapping until the
+        # external links change; this method is called per mouseover event.
+        links = self.session.application.data_collection.external_links
+        if self._alignment_cache is None or self._alignment_cache[0] != links:
+            mapping = {}
+            for elink in links:
+                pair = frozenset((elink.data1.label, elink.data2.label))
+                if pair not in mapping:  # Might have duplicate, just grab first match
+                    if isinstance(elink, LinkSame):  # Assumes WCS link never uses LinkSame
+                        mapping[pair] = 'pixels'
+                    else:  # If not pixels, must be WCS
+                        mapping[pair] = 'wcs'
+            self._alignment_cache = (links, mapping)
+
+        align_by = self._alignment_cache[1].get(frozenset((data_label, ref_label)))
 
         if align_by is None:
             raise ValueError(f'{data_label} not found in data collection external links')
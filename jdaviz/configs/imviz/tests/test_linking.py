@@ -11,17 +11,41 @@ from jdaviz.configs.imviz.tests.utils import (
     BaseImviz_WCS_NoWCS, BaseImviz_WCS_WCS, BaseImviz_WCS_GWCS, BaseImviz_GWCS_GWCS)
 
 
+WCS_LINK_CLASSES = (AffineLink, OffsetLink)
+
+# Shared event payloads; the handlers only read them.
+MOUSEMOVE_ORIGIN = {'event': 'mousemove', 'domain': {'x': 0, 'y': 0}}
+MOUSEMOVE_NEG1 = {'event': 'mousemove', 'domain': {'x': -1, 'y': -1}}
+KEYDOWN_B_ORIGIN = {'event': 'keydown', 'key': 'b', 'domain': {'x': 0, 'y': 0}}
+KEYDOWN_B_NEG1 = {'event': 'keydown', 'key': 'b', 'domain': {'x': -1, 'y': -1}}
+
+# Pixel (0, 0) readout, allowing for signed-zero formatting differences.
+PIXEL_00_READOUTS = frozenset((
+    'Pixel x=00.0 y=00.0 Value +1.00000e+00 electron / s',
+    'Pixel x=-0.0 y=00.0 Value +1.00000e+00 electron / s',
+    'Pixel x=00.0 y=-0.0 Value +1.00000e+00 electron / s',
+    'Pixel x=-0.0 y=-0.0 Value +1.00000e+00 electron / s'))
+
+
 class BaseLinkHandler:
 
+    @property
+    def label_mouseover(self):
+        # Cache the tool: resolving the attribute chain and dict lookup on
+        # every event adds up in tests that fire many mouse events.
+        if getattr(self, '_label_mouseover', None) is None:
+            self._label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
+        return self._label_mouseover
+
     def check_all_pixel_links(self):
         links = self.imviz.app.data_collection.external_links
         assert len(links) == 2
-        assert all([isinstance(link, LinkSame) for link in links])
+        assert all(isinstance(link, LinkSame) for link in links)
 
     def check_all_wcs_links(self):
         links = self.imviz.app.data_collection.external_links
         assert len(links) == 3
-        assert all([isinstance(link, (AffineLink, OffsetLink)) for link in links])
+        assert all(isinstance(link, WCS_LINK_CLASSES) for link in links)
 
     def test_pixel_linking(self):
         self.imviz.link_data(align_by='pixels')
@@ -29,10 +53,8 @@ class BaseLinkHandler:
 
     @property
     def default_viewer_limits(self):
-        return (self.imviz.default_viewer._obj.state.x_min,
-                self.imviz.default_viewer._obj.state.x_max,
-                self.imviz.default_viewer._obj.state.y_min,
-                self.imviz.default_viewer._obj.state.y_max)
+        state = self.imviz.default_viewer._obj.state
+        return (state.x_min, state.x_max, state.y_min, state.y_max)
 
 
 class TestLink_WCS_NoWCS(BaseImviz_WCS_NoWCS, BaseLinkHandler):
@@ -44,9 +66,8 @@ class TestLink_WCS_NoWCS(BaseImviz_WCS_NoWCS, BaseLinkHandler):
 
         # Also check the coordinates display: Last loaded is on top.
 
-        label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
-        label_mouseover._viewer_mouse_event(self.viewer,
-                                            {'event': 'mousemove', 'domain': {'x': 0, 'y': 0}})
+        label_mouseover = self.label_mouseover
+        label_mouseover._viewer_mouse_event(self.viewer, MOUSEMOVE_ORIGIN)
 
         assert label_mouseover.as_text() == (
             'Pixel x=00.3 y=00.2 Value +0.00000e+00',
@@ -68,15 +89,12 @@ class TestLink_WCS_FakeWCS(BaseImviz_WCS_NoWCS, BaseLinkHandler):
 
         # Also check the coordinates display: Last loaded is on top.
 
-        label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
-        label_mouseover._viewer_mouse_event(self.viewer,
-                                            {'event': 'mousemove',
-                                             'domain': {'x': 0, 'y': 0}})
+        label_mouseover = self.label_mouseover
+        label_mouseover._viewer_mouse_event(self.viewer, MOUSEMOVE_ORIGIN)
         assert label_mouseover.as_text() == ('Pixel x=00.0 y=00.0 Value +0.00000e+00', '', '')
 
         # blink image through keypress
-        self.viewer.on_mouse_or_key_event({'event': 'keydown', 'key': 'b',
-                                           'domain': {'x': 0, 'y': 0}})
+        self.viewer.on_mouse_or_key_event(KEYDOWN_B_ORIGIN)
         assert label_mouseover.as_text() == ('Pixel x=00.0 y=00.0 Value +0.00000e+00',
                                              'World 22h30m04.8674s -20d49m59.9990s (ICRS)',
                                              '337.5202808000 -20.8333330600 (deg)')
@@ -141,10 +159,8 @@ class TestLink_WCS_WCS(BaseImviz_WCS_WCS, BaseLinkHandler):
 
         # Also check the coordinates display: Last loaded is on top.
 
-        label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
-        label_mouseover._viewer_mouse_event(self.viewer,
-                                            {'event': 'mousemove',
-                                             'domain': {'x': 0, 'y': 0}})
+        label_mouseover = self.label_mouseover
+        label_mouseover._viewer_mouse_event(self.viewer, MOUSEMOVE_ORIGIN)
 
         lmtext = label_mouseover.as_text()
         assert lmtext[0] == 'Pixel x=01.3 y=00.2 Value +1.00000e+00'
@@ -244,12 +260,7 @@ class TestLink_WCS_GWCS(BaseImviz_WCS_GWCS):
         self.viewer.blink_once()
         label_mouseover._viewer_mouse_event(
             self.viewer, {'event': 'mousemove', 'domain': {'x': xy[0], 'y': xy[1]}})
-        assert label_mouseover.as_text()[0] in (
-            'Pixel x=00.0 y=00.0 Value +1.00000e+00 electron / s',
-            'Pixel x=-0.0 y=00.0 Value +1.00000e+00 electron / s',
-            'Pixel x=00.0 y=-0.0 Value +1.00000e+00 electron / s',
-            'Pixel x=-0.0 y=-0.0 Value +1.00000e+00 electron / s'
-        )
+        assert label_mouseover.as_text()[0] in PIXEL_00_READOUTS
         assert label_mouseover.as_text()[1:] == ('World 00h14m19.6141s -30d23m31.4091s (ICRS)',
                                                  '3.5817255823 -30.3920580740 (deg)')
         assert not label_mouseover.row1_unreliable
@@ -269,8 +280,7 @@ class TestLink_GWCS_GWCS(BaseImviz_GWCS_GWCS):
 
         # Check the coordinates display: Last loaded is on top.
         label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
-        label_mouseover._viewer_mouse_event(self.viewer,
-                                            {'event': 'mousemove', 'domain': {'x': -1, 'y': -1}})
+        label_mouseover._viewer_mouse_event(self.viewer, MOUSEMOVE_NEG1)
         assert label_mouseover.as_text() == ('Pixel x=-1.0 y=-1.0',
                                              'World 00h14m19.5987s -30d23m31.0683s (ICRS)',
                                              '3.5816611274 -30.3919634282 (deg)')
@@ -279,11 +289,8 @@ class TestLink_GWCS_GWCS(BaseImviz_GWCS_GWCS):
         assert label_mouseover.row3_unreliable
 
         # Back to reference image with bounds check.
-        label_mouseover._viewer_mouse_event(self.viewer,
-                                            {'event': 'keydown', 'key': 'b',
-                                             'domain': {'x': -1, 'y': -1}})
-        self.viewer.on_mouse_or_key_event({'event': 'keydown', 'key': 'b',
-                                           'domain': {'x': -1, 'y': -1}})
+        label_mouseover._viewer_mouse_event(self.viewer, KEYDOWN_B_NEG1)
+        self.viewer.on_mouse_or_key_event(KEYDOWN_B_NEG1)
         assert label_mouseover.as_text() == ('Pixel x=-1.0 y=-1.0',
                                              'World 00h14m19.5829s -30d23m30.9860s (ICRS)',
                                              '3.5815955408 -30.3919405616 (deg)')
@@ -8,6 +8,19 @@ from regions import EllipseSkyRegion, RectangleSkyRegion
 
 from jdaviz.configs.imviz.tests.utils import BaseImviz_WCS_WCS
 
+KEYDOWN_M = {'event': 'keydown', 'key': 'm'}
+
+# add_markers only reads the table, so one instance can serve every test.
+MARKER_TBL = Table({'x': (0, 0), 'y': (0, 1)})
+_MOUSEMOVE_EVENT = {'event': 'mousemove', 'domain': {'x': 0, 'y': 0}}
+
+
+def _mousemove(label_mouseover, viewer, x, y):
+    # Reuse one event payload across synthetic events; the handler only reads it.
+    _MOUSEMOVE_EVENT['domain']['x'] = x
+    _MOUSEMOVE_EVENT['domain']['y'] = y
+    label_mouseover._viewer_mouse_event(viewer, _MOUSEMOVE_EVENT)
+
 
 class TestDefaultOrientation(BaseImviz_WCS_WCS):
     def test_affine_reset_and_linktype(self):
@@ -33,8 +46,7 @@ class TestDefaultOrientation(BaseImviz_WCS_WCS):
 
         # Adding markers should disable changing linking from both UI and API.
         assert lc_plugin._obj.need_clear_astrowidget_markers is False
-        tbl = Table({'x': (0, 0), 'y': (0, 1)})
-        self.viewer.add_markers(tbl, marker_name='xy_markers')
+        self.viewer.add_markers(MARKER_TBL, marker_name='xy_markers')
 
         assert lc_plugin._obj.need_clear_astrowidget_markers is True
         with pytest.raises(ValueError, match="cannot change linking"):
@@ -50,24 +62,21 @@ class TestDefaultOrientation(BaseImviz_WCS_WCS):
         lc_plugin = self.imviz.plugins['Orientation']
         lc_plugin.align_by = 'Pixels'
 
-        # Blink to second image, if we have to.
-        if self.viewer.top_visible_data_label != "has_wcs_2[SCI,1]":
-            self.viewer.blink_once()
+        # Make sure the second image is on top.
+        self.viewer._set_top_visible_data("has_wcs_2[SCI,1]")
 
         label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
         mp = self.imviz.plugins['Markers']
 
         with mp.as_active():
             # (1, 0) on second image but same sky coordinates as (0, 0) on first.
-            label_mouseover._viewer_mouse_event(
-                self.viewer, {'event': 'mousemove', 'domain': {'x': 1, 'y': 0}})
-            mp._obj._on_viewer_key_event(self.viewer, {'event': 'keydown', 'key': 'm'})
+            _mousemove(label_mouseover, self.viewer, 1, 0)
+            mp._obj._on_viewer_key_event(self.viewer, KEYDOWN_M)
 
             # (0, 0) on first image.
-            self.viewer.blink_once()
-            label_mouseover._viewer_mouse_event(
-                self.viewer, {'event': 'mousemove', 'domain': {'x': 0, 'y': 0}})
-            mp._obj._on_viewer_key_event(self.viewer, {'event': 'keydown', 'key': 'm'})
+            self.viewer._set_top_visible_data("has_wcs_1[SCI,1]")
+            _mousemove(label_mouseover, self.viewer, 0, 0)
+            mp._obj._on_viewer_key_event(self.viewer, KEYDOWN_M)
 
             lc_plugin.align_by = 'WCS'
 
@@ -86,24 +95,21 @@ class TestDefaultOrientation(BaseImviz_WCS_WCS):
         lc_plugin = self.imviz.plugins['Orientation']
         lc_plugin.align_by = 'WCS'
 
-        # Blink to second image, if we have to.
-        if self.viewer.top_visible_data_label != "has_wcs_2[SCI,1]":
-            self.viewer.blink_once()
+        # Make sure the second image is on top.
+        self.viewer._set_top_visible_data("has_wcs_2[SCI,1]")
 
         label_mouseover = self.imviz.app.session.application._tools['g-coords-info']
         mp = self.imviz.plugins['Markers']
 
         with mp.as_active():
             # (0, 0) on second image, but linked by WCS.
-            label_mouseover._viewer_mouse_event(
-                self.viewer, {'event': 'mousemove', 'domain': {'x': 0, 'y': 0}})
-            mp._obj._on_viewer_key_event(self.viewer, {'event': 'keydown', 'key': 'm'})
+            _mousemove(label_mouseover, self.viewer, 0, 0)
+            mp._obj._on_viewer_key_event(self.viewer, KEYDOWN_M)
 
             # (0, 0) on first image.
-            self.viewer.blink_once()
-            label_mouseover._viewer_mouse_event(
-                self.viewer, {'event': 'mousemove', 'domain': {'x': 0, 'y': 0}})
-            mp._obj._on_viewer_key_event(self.viewer, {'event': 'keydown', 'key': 'm'})
+            self.viewer._set_top_visible_data("has_wcs_1[SCI,1]")
+            _mousemove(label_mouseover, self.viewer, 0, 0)
+            mp._obj._on_viewer_key_event(self.viewer, KEYDOWN_M)
 
             lc_plugin.align_by = 'Pixels'
 
@@ -134,8 +140,10 @@ class TestNonDefaultOrientation(BaseImviz_WCS_WCS):
 
         lc_plugin._obj.create_north_up_east_right(set_on_create=True)
 
-        assert self.viewer.state.reference_data.label == "North-up, East-left"
-        assert viewer_2.state.reference_data.label == "North-up, East-right"
+        viewer_1_state = self.viewer.state
+        viewer_2_state = viewer_2.state
+        assert viewer_1_state.reference_data.label == "North-up, East-left"
+        assert viewer_2_state.reference_data.label == "North-up, East-right"
 
         # Change orientation in imviz-1 from UI and ensure plugin selection is the same
         lc_plugin.viewer.selected = "imviz-0"
@@ -144,12 +152,12 @@ class TestNonDefaultOrientation(BaseImviz_WCS_WCS):
 
         # Both viewers should revert back to same reference when pixel-linked.
         lc_plugin.align_by = 'Pixels'
-        assert self.viewer.state.reference_data.label == "has_wcs_1[SCI,1]"
-        assert viewer_2.state.reference_data.label == "has_wcs_1[SCI,1]"
+        assert viewer_1_state.reference_data.label == "has_wcs_1[SCI,1]"
+        assert viewer_2_state.reference_data.label == "has_wcs_1[SCI,1]"
 
         lc_plugin.align_by = 'WCS'
-        assert self.viewer.state.reference_data.label == "Default orientation"
-        assert viewer_2.state.reference_data.label == "Default orientation"
+        assert viewer_1_state.reference_data.label == "Default orientation"
+        assert viewer_2_state.reference_data.label == "Default orientation"
 
     def test_custom_orientation(self):
         lc_plugin = self.imviz.plugins['Orientation']
@@ -205,13 +213,14 @@ class TestDeleteOrientation(BaseImviz_WCS_WCS):
         self.imviz.app.vue_data_item_remove({"item_name": "North-up, East-left"})
 
         # Check that E-right still linked to default
-        assert len(self.imviz.app.data_collection.external_links) == 3
-        assert self.imviz.app.data_collection.external_links[2].data1.label == "North-up, East-right"  # noqa: E501
-        assert self.imviz.app.data_collection.external_links[2].data2.label == "Default orientation"
+        dc = self.imviz.app.data_collection
+        assert len(dc.external_links) == 3
+        assert dc.external_links[2].data1.label == "North-up, East-right"
+        assert dc.external_links[2].data2.label == "Default orientation"
 
         # Check that the subset got reparented and the angle is correct in the display
-        subset_group = self.imviz.app.data_collection.subset_groups[0]
-        nuer_data = self.imviz.app.data_collection['North-up, East-right']
+        subset_group = dc.subset_groups[0]
+        nuer_data = dc['North-up, East-right']
         assert subset_group.subset_state.xatt in nuer_data.components
         assert_allclose(subset_group.subset_state.roi.theta, sbst_theta, rtol=1e-5)
 
@@ -1,6 +1,7 @@
 import os
 import warnings
 from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from zipfile import is_zipfile
 
@@ -25,6 +26,12 @@ from jdaviz.configs.default.plugins.line_lists.line_list_mixin import LineListMi
 __all__ = ['Mosviz']
 
 
+@lru_cache(maxsize=128)
+def _parse_unit(unit_str):
+    """Cached unit-string parse; MOS tables draw from a small set of units."""
+    return u.Unit(unit_str)
+
+
 class Mosviz(ConfigHelper, LineListMixin):
     """Mosviz Helper class"""
 
@@ -325,93 +332,123 @@ class Mosviz(ConfigHelper, LineListMixin):
         if isinstance(instrument, str):
             instrument = instrument.lower()
 
+        # Treat empty inputs as nothing to load so callers can reload a single
+        # class of data without paying for no-op parser dispatch on the rest.
+        if isinstance(spectra_1d, (list, tuple)) and len(spectra_1d) == 0:
+            spectra_1d = None
+        if isinstance(spectra_2d, (list, tuple)) and len(spectra_2d) == 0:
+            spectra_2d = None
+        if isinstance(images, (list, tuple)) and len(images) == 0:
+            images = None
+
         if images is not None and not isinstance(images, (list, tuple)):
             single_image = True
         else:
             single_image = False
 
+        # Validate the inputs before disabling link-manager syncing below, so
+        # bad arguments cannot leave the data collection in a delayed state.
         if directory is not None:
             if is_zipfile(str(directory)):
                 raise TypeError("Please extract your data first and provide the directory")
-            elif os.path.isdir(directory):
-                if instrument not in ('nirspec', 'niriss', 'nircam'):
-                    raise ValueError(
-                        "Ambiguous MOS Instrument: Only JWST NIRSpec, NIRCam, and "
-                        f"NIRISS folder parsing are currently supported but got '{instrument}'")
+            if not os.path.isdir(directory):
+                raise NotImplementedError(f"{directory} is not a directory")
+            if instrument not in ('nirspec', 'niriss', 'nircam'):
+                raise ValueError(
+                    "Ambiguous MOS Instrument: Only JWST NIRSpec, NIRCam, and "
+                    f"NIRISS folder parsing are currently supported but got '{instrument}'")
+        elif not spectra_1d and not spectra_2d:
+            raise NotImplementedError(
+                "Please set valid values for the Mosviz.load_data() method")
+
+        # Defer the link-manager tree rebuild until all sub-loaders have run;
+        # each parser otherwise triggers its own sync on exit.  The counter is
+        # managed by hand because ``delay_link_manager_update`` does not
+        # restore it when the block raises, which would leave link syncing
+        # disabled for the rest of the session.
+        dc = self.app.data_collection
+        dc._disable_sync_link_manager += 1
+        try:
+            if directory is not None:
                 if instrument == "nirspec":
-                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser")
+                    super().load_data(
+                        directory, parser_reference="mosviz-nirspec-directory-parser")
                 else:  # niriss or nircam
                     self.load_jwst_directory(directory, instrument=instrument)
-            else:
-                raise NotImplementedError(f"{directory} is not a directory")
-
-        # For the following, always load in this order: 1d, 2d, images, metadata
-
-        elif (spectra_1d is not None and spectra_2d is not None
-                and images is not None):
-            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
 
-            # If we have a single image for multiple spectra, tell the table viewer.
-            if single_image:
-                self._shared_image = True
-                self.app.get_viewer(self._default_table_viewer_reference_name)._shared_image = True
-                if n_specs > 1:
-                    self.load_images(images, images_label, share_image=n_specs)
+            # For the following, always load in this order: 1d, 2d, images, metadata
+
+            elif (spectra_1d is not None and spectra_2d is not None
+                    and images is not None):
+                n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
+                self.load_2d_spectra(spectra_2d, spectra_2d_label)
+
+                # If we have a single image for multiple spectra, tell the table viewer.
+                if single_image:
+                    self._shared_image = True
+                    table_viewer = self.app.get_viewer(
+                        self._default_table_viewer_reference_name)
+                    table_viewer._shared_image = True
+                    if n_specs > 1:
+                        self.load_images(images, images_label, share_image=n_specs)
+                    else:
+                        self.load_images(images, images_label)
                 else:
                     self.load_images(images, images_label)
-            else:
-                self.load_images(images, images_label)
-
-            self.load_metadata()
-
-        elif spectra_1d is not None and spectra_2d is not None:
-            self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
-            self.load_metadata()
 
-        elif spectra_1d and images:
-            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
-
-            # If we have a single image for multiple spectra, tell the table viewer.
-            if single_image:
-                self._shared_image = True
-                self.app.get_viewer(self._default_table_viewer_reference_name)._shared_image = True
-                if n_specs > 1:
-                    self.load_images(images, images_label, share_image=n_specs)
+                self.load_metadata()
+
+            elif spectra_1d is not None and spectra_2d is not None:
+                self.load_1d_spectra(spectra_1d, spectra_1d_label)
+                self.load_2d_spectra(spectra_2d, spectra_2d_label)
+                self.load_metadata()
+
+            elif spectra_1d and images:
+                n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
+
+                # If we have a single image for multiple spectra, tell the table viewer.
+                if single_image:
+                    self._shared_image = True
+                    table_viewer = self.app.get_viewer(
+                        self._default_table_viewer_reference_name)
+                    table_viewer._shared_image = True
+                    if n_specs > 1:
+                        self.load_images(images, images_label, share_image=n_specs)
+                    else:
+                        self.load_images(images, images_label)
                 else:
                     self.load_images(images, images_label)
-            else:
-                self.load_images(images, images_label)
-
-            allow_link_table = False
 
-        elif spectra_2d and images:
-            n_specs = self.load_2d_spectra(spectra_2d, spectra_2d_label)
-
-            # If we have a single image for multiple spectra, tell the table viewer.
-            if single_image:
-                self._shared_image = True
-                self.app.get_viewer(self._default_table_viewer_reference_name)._shared_image = True
-                if n_specs > 1:
-                    self.load_images(images, images_label, share_image=n_specs)
+                allow_link_table = False
+
+            elif spectra_2d and images:
+                n_specs = self.load_2d_spectra(spectra_2d, spectra_2d_label)
+
+                # If we have a single image for multiple spectra, tell the table viewer.
+                if single_image:
+                    self._shared_image = True
+                    table_viewer = self.app.get_viewer(
+                        self._default_table_viewer_reference_name)
+                    table_viewer._shared_image = True
+                    if n_specs > 1:
+                        self.load_images(images, images_label, share_image=n_specs)
+                    else:
+                        self.load_images(images, images_label)
                 else:
                     self.load_images(images, images_label)
-            else:
-                self.load_images(images, images_label)
 
-            allow_link_table = False
+                allow_link_table = False
 
-        elif spectra_1d:
-            self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            allow_link_table = False
+            elif spectra_1d:
+                self.load_1d_spectra(spectra_1d, spectra_1d_label)
+                allow_link_table = False
 
-        elif spectra_2d:
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
-            allow_link_table = False
-
-        else:
-            raise NotImplementedError("Please set valid values for the Mosviz.load_data() method")
+            elif spectra_2d:
+                self.load_2d_spectra(spectra_2d, spectra_2d_label)
+                allow_link_table = False
+        finally:
+            dc._disable_sync_link_manager -= 1
+            dc._sync_link_manager()
 
         if allow_link_table:
             self.link_table_data(None)
@@ -513,6 +550,8 @@ class Mosviz(ConfigHelper, LineListMixin):
             Number of data objects loaded.
 
         """
+        if data_obj is None or (isinstance(data_obj, (list, tuple)) and len(data_obj) == 0):
+            return 0
         n_specs = mos_spec1d_parser(self.app, data_obj, data_labels=data_labels)
         if add_redshift_column:
             self._add_redshift_column()
@@ -541,6 +580,8 @@ class Mosviz(ConfigHelper, LineListMixin):
             Number of data objects loaded.
 
         """
+        if data_obj is None or (isinstance(data_obj, (list, tuple)) and len(data_obj) == 0):
+            return 0
         n_specs = mos_spec2d_parser(self.app, data_obj, data_labels=data_labels)
         if add_redshift_column:
             self._add_redshift_column()
@@ -583,6 +624,8 @@ class Mosviz(ConfigHelper, LineListMixin):
         add_redshift_column : bool
             Add redshift column to Mosviz table.
         """
+        if data_obj is None or (isinstance(data_obj, (list, tuple)) and len(data_obj) == 0):
+            return
         super().load_data(data_obj, parser_reference="mosviz-image-parser",
                           data_labels=data_labels, share_image=share_image)
         if add_redshift_column:
@@ -804,22 +847,20 @@ class Mosviz(ConfigHelper, LineListMixin):
         """
         table_data = self.app.data_collection['MOS Table']
 
+        # Fetch all components up front; get_component walks glue internals.
+        cols = [(cid.label, table_data.get_component(cid)) for cid in table_data.components]
+
         data_dict = {}
 
-        for cid in table_data.components:
-            comp = table_data.get_component(cid)
+        for label, comp in cols:
             # Rename the first column to something more sensible
-            if cid.label == "Pixel Axis 0 [x]":
+            if label == "Pixel Axis 0 [x]":
                 label = "Table Index"
-            else:
-                label = cid.label
 
-            if comp.units is not None:
-                if comp.units == "":
-                    data_dict[label] = comp.data
-                else:
-                    unit = u.Unit(comp.units)
-                    data_dict[label] = comp.data * unit
+            if comp.units:
+                # Wrap the component array without copying; QTable construction
+                # copies anyway.
+                data_dict[label] = u.Quantity(comp.data, unit=_parse_unit(comp.units), copy=False)
             else:
                 data_dict[label] = comp.data
 
@@ -1,5 +1,6 @@
 from collections.abc import Iterable
 import csv
+import logging
 import os
 from pathlib import Path
 import warnings
@@ -18,6 +19,8 @@ from jdaviz.core.registries import data_parser_registry
 from jdaviz.core.events import SnackbarMessage
 from jdaviz.utils import standardize_metadata, PRIHDR_KEY, download_uri_to_path
 
+_logger = logging.getLogger(__name__)
+
 __all__ = ['mos_spec1d_parser', 'mos_spec2d_parser', 'mos_image_parser']
 
 FALLBACK_NAME = "Unspecified"
@@ -838,7 +841,7 @@ def mos_niriss_parser(app, data_dir, instrument=None,
     image_dict = {}
 
     if "Direct Image" in files_by_labels:
-        print("Loading: Images")
+        _logger.info("Loading: Images")
         for image_file in files_by_labels["Direct Image"]:
             # save label for table viewer
             im_split = image_file.stem.split("_")[0]
@@ -873,7 +876,7 @@ def mos_niriss_parser(app, data_dir, instrument=None,
 
     for flabel in file_labels_2d:
         for fname in files_by_labels[flabel]:
-            print(f"Loading: {flabel} sources")
+            _logger.info("Loading: %s sources", flabel)
             if flabel in ('2D Spectra R', '2D Spectra C'):
                 if instrument == "niriss":
                     filter_name = fits.getheader(fname, ext=0).get('PUPIL')
@@ -942,7 +945,7 @@ def mos_niriss_parser(app, data_dir, instrument=None,
 
     for flabel in file_labels_1d:
         for fname in files_by_labels[flabel]:
-            print(f"Loading: {flabel} sources")
+            _logger.info("Loading: %s sources", flabel)
 
             with fits.open(fname, memmap=False) as temp:
                 # Filter out HDUs we care about
@@ -1,5 +1,5 @@
 from contextlib import nullcontext
-from functools import cached_property
+from functools import cached_property, lru_cache
 
 from astropy import units as u
 from glue.core.subset_group import GroupedSubset
@@ -22,27 +22,48 @@ from jdaviz.utils import _eqv_flux_to_sb_pixel, _eqv_pixar_sr
 __all__ = ['UnitConversion']
 
 
+@lru_cache(maxsize=256)
+def _cached_unit(unit_str):
+    # intern parsed units; the same few strings are parsed on every event
+    return u.Unit(unit_str)
+
+
+@lru_cache(maxsize=32)
+def _display_unit_choices(choices_str):
+    # parse each glue choice list once, shared across all requested unit strings
+    return [_cached_unit(choice) for choice in choices_str]
+
+
+@lru_cache(maxsize=256)
+def _match_display_unit(unit_str, axis, choices_str):
+    # parse the unit string and each choice once per (unit, choices) combination;
+    # unit parsing is expensive and these are re-requested on every unit-change event
+    unit_u = _cached_unit(unit_str)
+    choices_u = _display_unit_choices(choices_str)
+    if unit_u not in choices_u:
+        raise ValueError(f"{unit_str} could not find match in valid {axis} display units {choices_str}")  # noqa
+    ind = choices_u.index(unit_u)
+    return choices_str[ind]
+
+
 def _valid_glue_display_unit(unit_str, sv, axis='x'):
     # need to make sure the unit string is formatted according to the list of valid choices
     # that glue will accept (may not be the same as the defaults of the installed version of
     # astropy)
     if not unit_str:
         return unit_str
-    unit_u = u.Unit(unit_str)
+    # the available choices depend on the state instance (its loaded data), so key
+    # the cache on the choices themselves rather than the viewer
     choices_str = getattr(sv.state.__class__, f'{axis}_display_unit').get_choices(sv.state)
-    choices_str = [choice for choice in choices_str if choice is not None]
-    choices_u = [u.Unit(choice) for choice in choices_str]
-    if unit_u not in choices_u:
-        raise ValueError(f"{unit_str} could not find match in valid {axis} display units {choices_str}")  # noqa
-    ind = choices_u.index(unit_u)
-    return choices_str[ind]
+    choices_str = tuple(choice for choice in choices_str if choice is not None)
+    return _match_display_unit(unit_str, axis, choices_str)
 
 
+@lru_cache(maxsize=256)
 def _flux_to_sb_unit(flux_unit, angle_unit):
     if angle_unit not in supported_sq_angle_units(as_strings=True):
         sb_unit = flux_unit
-    elif '(' in flux_unit:
-        pos = flux_unit.rfind(')')
+    elif (pos := flux_unit.rfind(')')) != -1:
         sb_unit = flux_unit[:pos] + ' ' + angle_unit + flux_unit[pos:]
     else:
         # append angle if there are no parentheses
@@ -379,18 +400,19 @@ class UnitConversion(PluginTemplateMixin):
             layers = self.image_layers
 
         for layer in layers:
+            data = layer.layer
             # DQ layer doesn't play nicely with this attribute
-            if "DQ" in layer.layer.label or isinstance(layer.layer, GroupedSubset):
+            if "DQ" in data.label or isinstance(data, GroupedSubset):
                 continue
-            elif ("flux" not in [str(c) for c in layer.layer.components]
-                    or u.Unit(layer.layer.get_component("flux").units).physical_type != 'surface brightness'):  # noqa
+            elif ("flux" not in [str(c) for c in data.components]
+                    or _cached_unit(data.get_component("flux").units).physical_type != 'surface brightness'):  # noqa
                 continue
             if hasattr(layer.state, 'attribute_display_unit'):
                 if self.config == "cubeviz":
                     ctx = u.set_enabled_equivalencies(
                         u.spectral() + u.spectral_density(self._cube_wave) +
                         _eqv_flux_to_sb_pixel() +
-                        _eqv_pixar_sr(layer.layer.meta.get('_pixel_scale_factor', 1)))
+                        _eqv_pixar_sr(data.meta.get('_pixel_scale_factor', 1)))
                 else:
                     ctx = nullcontext()
                 with ctx:
@@ -7,6 +7,10 @@ import yaml
 
 __all__ = ['read_configuration', 'get_configuration', 'list_configurations']
 
+# Parsed YAML trees keyed by (path, mtime); YAML parsing is slow enough to
+# matter when helpers are constructed repeatedly in one session.
+_config_cache = {}
+
 
 def read_configuration(path=None):
     """Loads a configuration from a YAML file.
@@ -45,10 +49,14 @@ def read_configuration(path=None):
     elif not os.path.isfile(path):
         raise ValueError("Configuration must be path to a .yaml file.")
 
-    with open(path, 'r') as f:
-        config = yaml.safe_load(f)
+    key = (str(path), os.path.getmtime(path))
+    if key not in _config_cache:
+        with open(path, 'r') as f:
+            _config_cache[key] = yaml.load(
+                f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
 
-    return config
+    # Deep copy so callers are free to mutate what they get back.
+    return copy.deepcopy(_config_cache[key])
 
 
 def get_configuration(path=None, section=None, config=None):
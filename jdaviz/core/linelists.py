@@ -1,3 +1,4 @@
+import copy
 import pkg_resources
 import json
 
@@ -5,14 +6,21 @@ from astropy.table import QTable
 
 __all__ = ['get_linelist_metadata', 'get_available_linelists', 'load_preset_linelist']
 
+_linelist_metadata_cache = None
+_preset_linelist_cache = {}
+
 
 def get_linelist_metadata():
     """Return metadata for line lists."""
-    metadata_file = pkg_resources.resource_filename("jdaviz",
-                                                    "data/linelists/linelist_metadata.json")
-    with open(metadata_file) as f:
-        metadata = json.load(f)
-    return metadata
+    global _linelist_metadata_cache
+    if _linelist_metadata_cache is None:
+        metadata_file = pkg_resources.resource_filename("jdaviz",
+                                                        "data/linelists/linelist_metadata.json")
+        with open(metadata_file) as f:
+            _linelist_metadata_cache = json.load(f)
+    # Deep copy so callers cannot clobber the cached entries (the per-list
+    # values are themselves mutable dicts).
+    return copy.deepcopy(_linelist_metadata_cache)
 
 
 def get_available_linelists():
@@ -33,19 +41,23 @@ def load_preset_linelist(name):
     if name not in metadata.keys():
         raise ValueError("Line name not in available set of line lists. " +
                          "Valid list names are: {}".format(list(metadata.keys())))
-    fname_base = metadata[name]["filename_base"]
-    fname = pkg_resources.resource_filename("jdaviz",
-                                            "data/linelists/{}.csv".format(fname_base))
-    units = metadata[name]["units"]
-    linetable = QTable.read(fname)
+    if name not in _preset_linelist_cache:
+        fname_base = metadata[name]["filename_base"]
+        fname = pkg_resources.resource_filename("jdaviz",
+                                                "data/linelists/{}.csv".format(fname_base))
+        units = metadata[name]["units"]
+        linetable = QTable.read(fname)
+
+        # Add units
+        linetable['Rest Value'].unit = units
 
-    # Add units
-    linetable['Rest Value'].unit = units
+        # Add column with list name reference
+        linetable['listname'] = name
 
-    # Add column with list name reference
-    linetable['listname'] = name
+        # Rename remaining columns
+        linetable.rename_columns(('Line Name', 'Rest Value'), ('linename', 'rest'))
 
-    # Rename remaining columns
-    linetable.rename_columns(('Line Name', 'Rest Value'), ('linename', 'rest'))
+        _preset_linelist_cache[name] = linetable
 
-    return linetable
+    # Copy so callers can add columns (e.g., colors) without polluting the cache.
+    return _preset_linelist_cache[name].copy()
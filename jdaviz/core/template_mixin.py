@@ -1520,8 +1520,8 @@ class LayerSelect(SelectPluginComponent):
             if self.plugin.config != 'cubeviz':
                 return True
             # note: have to check the classname instead of isinstance to avoid circular import
-            if np.any([viewer.__class__.__name__ != 'CubevizProfileView'
-                       for viewer in self.viewer_objs]):
+            if any(viewer.__class__.__name__ != 'CubevizProfileView'
+                   for viewer in self.viewer_objs):
                 return True
             # at this point, we are in cubeviz and ALL selected viewers are profile viewers,
             # so we want to exclude spatial subsets
@@ -2049,7 +2049,7 @@ class SubsetSelect(SelectPluginComponent):
         types = self.selected_item.get('type')
         if not isinstance(types, list):
             types = [types]
-        if np.any([type not in ('spatial', None) for type in types]):
+        if any(type not in ('spatial', None) for type in types):
             raise TypeError("This action is only supported on spatial-type subsets")
         if self.is_multiselect:
             return [self._get_spatial_region(dataset=self.dataset.selected, subset=subset) for subset in self.selected]  # noqa
@@ -2371,7 +2371,7 @@ class ApertureSubsetSelect(SubsetSelect):
 
         # if any of the selected entries are composite, then _get_spatial_region
         # (or selected_spatial_region) will fail.
-        if np.any([len(obj) > 1 for obj in objs]):
+        if any(len(obj) > 1 for obj in objs):
             validity = {'is_aperture': False,
                         'aperture_message': 'composite subsets are not supported',
                         'is_composite': True}
@@ -1,4 +1,5 @@
 from astropy import units as u
+from functools import lru_cache
 import itertools
 
 from jdaviz.core.custom_units import PIX2, SPEC_PHOTON_FLUX_DENSITY_UNITS
@@ -47,19 +48,29 @@ def units_to_strings(unit_list):
     return [u.Unit(unit).to_string() for unit in unit_list]
 
 
-def create_spectral_equivalencies_list(spectral_axis_unit,
-                                       exclude=[u.jupiterRad, u.earthRad, u.solRad,
-                                                u.lyr, u.AU, u.pc, u.Bq, u.micron, u.lsec]):
+def create_spectral_equivalencies_list(spectral_axis_unit, exclude=None):
     """Get all possible conversions from current spectral_axis_unit."""
     if spectral_axis_unit in (u.pix, u.dimensionless_unscaled):
         return [spectral_axis_unit]
 
+    if exclude is None:
+        exclude = (u.jupiterRad, u.earthRad, u.solRad,
+                   u.lyr, u.AU, u.pc, u.Bq, u.micron, u.lsec)
+
+    return list(_spectral_equivalencies(spectral_axis_unit.to_string(), tuple(exclude)))
+
+
+@lru_cache(maxsize=64)
+def _spectral_equivalencies(spectral_axis_unit_str, exclude):
+    # cached on the string form; rebuilt lists are identical for the same unit
+    spectral_axis_unit = u.Unit(spectral_axis_unit_str)
+
     # Get unit equivalencies.
     try:
         curr_spectral_axis_unit_equivalencies = spectral_axis_unit.find_equivalent_units(
             equivalencies=u.spectral())
     except u.core.UnitConversionError:
-        return []
+        return ()
 
     # Get local units.
     locally_defined_spectral_axis_units = ['Angstrom', 'nm',
@@ -68,14 +79,14 @@ def create_spectral_equivalencies_list(spectral_axis_unit,
 
     # Remove overlap units.
     curr_spectral_axis_unit_equivalencies = list(set(curr_spectral_axis_unit_equivalencies)
-                                                 - set(local_units + exclude))
+                                                 - set(local_units + list(exclude)))
 
     # Convert equivalencies into readable versions of the units and sorted alphabetically.
     spectral_axis_unit_equivalencies_titles = sorted(units_to_strings(
         curr_spectral_axis_unit_equivalencies))
 
     # Concatenate both lists with the local units coming first.
-    return sorted(units_to_strings(local_units)) + spectral_axis_unit_equivalencies_titles
+    return tuple(sorted(units_to_strings(local_units)) + spectral_axis_unit_equivalencies_titles)
 
 
 def create_flux_equivalencies_list(flux_unit):
@@ -92,7 +103,12 @@ def create_flux_equivalencies_list(flux_unit):
     only item in the dropdown will be the native unit.
     """
 
-    flux_unit_str = flux_unit.to_string()
+    return list(_flux_equivalencies(flux_unit.to_string()))
+
+
+@lru_cache(maxsize=64)
+def _flux_equivalencies(flux_unit_str):
+    flux_unit = u.Unit(flux_unit_str)
 
     # if flux_unit is a spectral or photon flux density unit, then the flux unit
     # dropdown options should be the loaded unit (which may have a different
@@ -101,16 +117,16 @@ def create_flux_equivalencies_list(flux_unit):
     for un in SPEC_PHOTON_FLUX_DENSITY_UNITS:
         if flux_unit.is_equivalent(un, equiv):
             if flux_unit_str not in SPEC_PHOTON_FLUX_DENSITY_UNITS:
-                return SPEC_PHOTON_FLUX_DENSITY_UNITS + [flux_unit_str]
+                return tuple(SPEC_PHOTON_FLUX_DENSITY_UNITS) + (flux_unit_str,)
             else:
-                return SPEC_PHOTON_FLUX_DENSITY_UNITS
+                return tuple(SPEC_PHOTON_FLUX_DENSITY_UNITS)
 
     else:
         # for any other units, including counts, DN, e/s, DN /s, etc,
         # no other conversions between flux units available as we only support
         # conversions to and from spectral and photon flux density flux unit.
         # dropdown will only contain one item (the input unit)
-        return [flux_unit_str]
+        return (flux_unit_str,)
 
 
 def create_angle_equivalencies_list(solid_angle_unit):
@@ -195,6 +211,13 @@ def check_if_unit_is_per_solid_angle(unit, return_unit=False):
     else:
         raise ValueError('Unit must be u.Unit, or string that can be converted into a u.Unit')
 
+    return _check_if_unit_str_is_per_solid_angle(unit_str, return_unit)
+
+
+@lru_cache(maxsize=512)
+def _check_if_unit_str_is_per_solid_angle(unit_str, return_unit):
+    # cached on the canonical unit string; the same few units are re-checked
+    # on every display-unit change event
     if '/' in unit_str:
         # input unit might be comprised of several units in denom. so check all.
         denom = unit_str.split('/')[-1].split()
@@ -11,12 +11,32 @@ import ipyvue
 import jdaviz
 from jdaviz.app import custom_components
 
+_JDAVIZ_DIR = os.path.dirname(jdaviz.__file__)
+
 config = None
 data_list = []
 load_data_kwargs = {}
 jdaviz_verbosity = 'error'
 jdaviz_history_verbosity = 'info'
 
+_registered_components = False
+
+
+def _register_components():
+    # registration is idempotent but reads every component file from disk,
+    # so only pay for it on the first page render
+    global _registered_components
+    if _registered_components:
+        return
+
+    ipysplitpanes.SplitPanes()
+    ipygoldenlayout.GoldenLayout()
+    for name, path in custom_components.items():
+        ipyvue.register_component_from_file(None, name, os.path.join(_JDAVIZ_DIR, path))
+
+    ipyvue.register_component_from_file('g-viewer-tab', "container.vue", jdaviz.__file__)
+    _registered_components = True
+
 
 @solara.lab.on_kernel_start
 def on_kernel_start():
@@ -40,13 +60,7 @@ def Page():
         solara.Text("No config defined")
         return
 
-    ipysplitpanes.SplitPanes()
-    ipygoldenlayout.GoldenLayout()
-    for name, path in custom_components.items():
-        ipyvue.register_component_from_file(None, name,
-                                            os.path.join(os.path.dirname(jdaviz.__file__), path))
-
-    ipyvue.register_component_from_file('g-viewer-tab', "container.vue", jdaviz.__file__)
+    _register_components()
 
     solara.Style(Path(__file__).parent / "solara.css")
 